@@ -14,7 +14,8 @@ States:
 - Transcribing (amber): Processing; then copies and auto-pastes (macOS) into the active app
 
 Dependencies:
-    pip install faster-whisper sounddevice numpy scipy pyperclip pynput
+    pip install faster-whisper sounddevice numpy pyperclip pynput
+    pip install numba  # optional: fused clip/peak kernel
 
 macOS notes:
 - To allow global hotkey listening and auto-paste (Cmd+V), grant Accessibility permission to Python:
@@ -23,14 +24,9 @@ macOS notes:
 
 import tkinter as tk
 import threading
+import queue
 import time
-import json
 import numpy as np
-import sounddevice as sd
-from scipy.io.wavfile import write
-from faster_whisper import WhisperModel
-import pyperclip
-import subprocess
 import platform
 import os
 from pathlib import Path
@@ -50,17 +46,23 @@ class Settings:
         self.config_path = Path.home() / ".superwhisper_config.json"
         self.defaults = {
             "model_size": "small",
+            "model_path": None,
             "silence_duration": 1.0,
             "max_duration": 30,
             "silence_threshold": 0.01,
             "sample_rate": 16000,
             "auto_paste": True,
+            "language": None,
+            "device": None,
+            "compute_type": None,
+            "cpu_threads": None,
             "window_x": 1200,
             "window_y": 120
         }
         self.load()
     
     def load(self):
+        import json
         try:
             if self.config_path.exists():
                 with open(self.config_path) as f:
@@ -79,6 +81,7 @@ class Settings:
                 setattr(self, key, value)
     
     def save(self):
+        import json
         try:
             config_data = {}
             for key in self.defaults.keys():
@@ -89,9 +92,6 @@ class Settings:
         except Exception:
             pass
 
-# Global settings instance
-settings = Settings()
-
 # UI Configuration - Enhanced Apple-like design
 BG_COLOR = "#1C1C1E"           # iOS dark background
 FG_TEXT = "#FFFFFF"            # Pure white text
@@ -122,6 +122,7 @@ else:
     ICON_FONT = ("Inter", 14, "bold")  # Reduced from 24
 
 HOTKEY_LABEL = "F9"
+HOTKEY_WIN32_VK = 0x78         # VK_F9
 
 # =========================
 # Custom Exceptions
@@ -132,6 +133,42 @@ class AudioError(Exception):
 class TranscriptionError(Exception):
     pass
 
+# =========================
+# Audio Kernels
+# =========================
+def _fused_clip_peak_py(buf, out):
+    """Clip buf to [-1, 1] into out and return the peak absolute amplitude."""
+    peak = float(max(buf.max(), -buf.min()))
+    np.clip(buf, -1.0, 1.0, out=out)
+    return peak
+
+def _fused_clip_peak_loop(buf, out):
+    """Single pass: clip buf to [-1, 1] into out and return the peak (numba source)."""
+    peak = 0.0
+    for i in range(buf.shape[0]):
+        x = buf[i]
+        a = abs(x)
+        if a > peak:
+            peak = a
+        if x > 1.0:
+            x = 1.0
+        elif x < -1.0:
+            x = -1.0
+        out[i] = x
+    return peak
+
+def build_fused_clip_peak():
+    """
+    Return _fused_clip_peak_loop compiled with numba, or the NumPy version if
+    numba is missing. Call off the UI thread: the numba import alone costs
+    several hundred ms.
+    """
+    try:
+        from numba import njit
+    except Exception:
+        return _fused_clip_peak_py
+    return njit(cache=True, fastmath=True)(_fused_clip_peak_loop)
+
 # =========================
 # Compact Circular Button
 # =========================
@@ -144,6 +181,7 @@ class CircularButton(tk.Canvas):
                         highlightthickness=0, bg=parent["bg"], bd=0, **kwargs)
         self.size = size
         self.color = color
+        self._cache_effect_colors(color)
         self.is_hovering = False
 
         # Subtle drop shadow (proportionally smaller)
@@ -170,6 +208,7 @@ class CircularButton(tk.Canvas):
     def set_state(self, color, icon):
         """Update color and icon with smooth transition."""
         self.color = color
+        self._cache_effect_colors(color)
         self.itemconfig(self.circle, fill=color)
         self.itemconfig(self.icon_text, text=icon)
         
@@ -177,6 +216,11 @@ class CircularButton(tk.Canvas):
         if self.is_hovering:
             self._apply_hover_effect()
 
+    def _cache_effect_colors(self, color):
+        """Precompute hover/click fills so events don't reparse hex."""
+        self._hover_fill = self._adjust_brightness(color, 1.15)
+        self._click_fill = self._adjust_brightness(color, 0.85)
+
     def _on_click(self, event):
         if self.action:
             # Visual feedback on click
@@ -193,8 +237,7 @@ class CircularButton(tk.Canvas):
 
     def _apply_hover_effect(self):
         """Apply subtle hover effect."""
-        hover_color = self._adjust_brightness(self.color, 1.15)
-        self.itemconfig(self.circle, fill=hover_color)
+        self.itemconfig(self.circle, fill=self._hover_fill)
 
     def _remove_hover_effect(self):
         """Remove hover effect."""
@@ -202,8 +245,7 @@ class CircularButton(tk.Canvas):
 
     def _animate_click(self):
         """Brief visual feedback on click."""
-        click_color = self._adjust_brightness(self.color, 0.85)
-        self.itemconfig(self.circle, fill=click_color)
+        self.itemconfig(self.circle, fill=self._click_fill)
         self.after(100, lambda: self.itemconfig(self.circle, fill=self.color))
 
     @staticmethod
@@ -239,8 +281,10 @@ class SuperWhisperApp:
     STATE_TRANSCRIBING = "transcribing"
     STATE_ERROR = "error"
 
-    def __init__(self, root):
+    def __init__(self, root, settings=None):
         self.root = root
+        # Loaded here rather than at import so the Tk root exists first
+        self.settings = settings or Settings()
         self._setup_window()
         
         # Thread safety
@@ -251,9 +295,15 @@ class SuperWhisperApp:
         # App state
         self.state = self.STATE_READY
         self.is_recording = False
-        self.audio_buffer = []
         self.model = None
-        self._temp_files = []
+        self._last_ui_status = None
+        
+        # Preallocated ring buffer for audio capture
+        max_samples = int(self.settings.max_duration * self.settings.sample_rate)
+        self._audio_ring = np.empty(max_samples, dtype=np.float32)
+        self._audio_write = 0
+        self._heard_voice = False
+        self._clip_peak = _fused_clip_peak_py  # replaced by the JIT kernel on load
         
         # Global hotkey
         self._listener = None
@@ -265,10 +315,11 @@ class SuperWhisperApp:
         # Setup cleanup and event handlers
         self.root.protocol("WM_DELETE_WINDOW", self.cleanup)
         self.root.bind("<Escape>", lambda e: self.cleanup())
-        self.root.bind("<F9>", lambda e: self._on_hotkey())
         
-        # Start services
-        self._start_global_hotkey()
+        # Start services; the global listener is authoritative for F9 and the
+        # Tk binding is only for a missing or untrusted listener
+        if not self._start_global_hotkey():
+            self.root.bind("<F9>", lambda e: self._on_hotkey())
         
         # Initialize to ready state
         self._set_ready_state()
@@ -282,7 +333,7 @@ class SuperWhisperApp:
         self.root.resizable(False, False)
         
         # Smaller, more rectangular layout
-        x, y = settings.window_x, settings.window_y
+        x, y = self.settings.window_x, self.settings.window_y
         self.root.geometry(f"180x120+{x}+{y}")  # Reduced from 240x180 to 180x120
         
         # Make window draggable
@@ -338,30 +389,141 @@ class SuperWhisperApp:
         # Load model asynchronously
         threading.Thread(target=self._load_model, daemon=True).start()
 
+    def _resolve_compute_type(self):
+        """Pick the fastest device/compute_type; _load_model caches it once warmed up."""
+        if self.settings.device and self.settings.compute_type:
+            return self.settings.device, self.settings.compute_type
+
+        import ctranslate2
+
+        device, compute_type = "cpu", "int8"
+        try:
+            if ctranslate2.get_cuda_device_count() > 0:
+                supported = ctranslate2.get_supported_compute_types("cuda")
+                if "int8_float16" in supported:
+                    device, compute_type = "cuda", "int8_float16"
+                elif "float16" in supported:
+                    device, compute_type = "cuda", "float16"
+        except Exception:
+            pass
+
+        if device == "cpu":
+            try:
+                if "int8" not in ctranslate2.get_supported_compute_types("cpu"):
+                    compute_type = "float32"
+            except Exception:
+                pass
+
+        return device, compute_type
+
+    def _warm_up(self, model):
+        """Transcribe one second of silence. Returns False if inference fails."""
+        try:
+            segments, _ = model.transcribe(
+                np.zeros(self.settings.sample_rate, dtype=np.float32),
+                vad_filter=False
+            )
+            list(segments)
+            return True
+        except Exception:
+            return False
+
+    def _resolve_cpu_threads(self):
+        """Thread count for CTranslate2, preferring performance cores only."""
+        if self.settings.cpu_threads:
+            return self.settings.cpu_threads
+
+        threads = max(1, (os.cpu_count() or 2) // 2)
+        if platform.system() == "Darwin" and platform.machine() == "arm64":
+            # Apple Silicon: use the P-core count to avoid cross-cluster sync
+            import subprocess
+            try:
+                result = subprocess.run(
+                    ["sysctl", "-n", "hw.perflevel0.physicalcpu"],
+                    check=True, timeout=2, capture_output=True, text=True
+                )
+                threads = max(1, int(result.stdout.strip()))
+            except Exception:
+                pass
+
+        self.settings.cpu_threads = threads
+        self.settings.save()
+        return threads
+
     def _load_model(self):
         """Load Whisper model with better error handling."""
         try:
-            self._set_status("Loading…")
+            self._post_status("Loading…")
             
-            # Try different model sizes based on available memory
-            model_sizes = [settings.model_size, "small", "tiny", "base"]
-            model_sizes = list(dict.fromkeys(model_sizes))  # Remove duplicates
+            # Import sounddevice here, not at module scope (UI paints first) nor
+            # on F9 (PortAudio init and device enumeration would eat the first
+            # words); a mic problem surfaces when recording starts instead
+            try:
+                import sounddevice as sd
+                sd.query_devices(kind="input")
+            except Exception:
+                pass
             
-            for size in model_sizes:
+            # Build the clip/peak kernel and run it once so the JIT compile
+            # (or cache load) doesn't land on the first transcription
+            try:
+                kernel = build_fused_clip_peak()
+                scratch = np.zeros(16, dtype=np.float32)
+                kernel(scratch, scratch)
+                self._clip_peak = kernel
+            except Exception:
+                pass
+            
+            # Deferred: pulls in CTranslate2/tokenizers, keep it off the UI path
+            from faster_whisper import WhisperModel
+            
+            def create_model(device, compute_type):
+                # model_path may name a pre-quantized int8 CT2 model (HF repo
+                # id or local dir); CT2 then loads int8 weights as-is instead
+                # of reading FP16 weights and quantizing them on load
+                return WhisperModel(
+                    self.settings.model_path or self.settings.model_size,
+                    device=device,
+                    compute_type=compute_type,
+                    cpu_threads=self._resolve_cpu_threads(),
+                    num_workers=1,
+                    download_root=Path.home() / ".cache" / "whisper"
+                )
+            
+            # Warm up with one second of silence so the first F9 isn't slow;
+            # self.model stays None until then so F9 can't race the warm-up
+            device, compute_type = self._resolve_compute_type()
+            model = None
+            warmed = False
+            if device != "cpu":
+                # A CUDA driver without the cuBLAS/cuDNN libraries can fail at
+                # load or only at first inference; fall back to CPU either way
                 try:
-                    self.model = WhisperModel(
-                        size, 
-                        device="cpu", 
-                        compute_type="int8",
-                        download_root=Path.home() / ".cache" / "whisper"
-                    )
-                    settings.model_size = size  # Save working model size
-                    settings.save()
-                    break
-                except Exception as e:
-                    if size == model_sizes[-1]:  # Last attempt
-                        raise e
-                    continue
+                    model = create_model(device, compute_type)
+                    warmed = self._warm_up(model)
+                except Exception:
+                    pass
+                if not warmed:
+                    model = None
+                    device, compute_type = "cpu", "int8"
+            
+            if model is None:
+                try:
+                    model = create_model(device, compute_type)
+                except Exception:
+                    # Drop any cached choice so the next launch probes again
+                    self.settings.device = None
+                    self.settings.compute_type = None
+                    self.settings.save()
+                    raise
+                warmed = self._warm_up(model)
+            
+            # Only cache a device/compute_type that actually ran inference
+            if warmed:
+                self.settings.device = device
+                self.settings.compute_type = compute_type
+                self.settings.save()
+            self.model = model
             
             self.root.after(0, self._set_ready_state)
             
@@ -386,7 +548,8 @@ class SuperWhisperApp:
                 
             self.state = self.STATE_RECORDING
             self.is_recording = True
-            self.audio_buffer.clear()  # Clear any previous buffer
+            self._audio_write = 0  # Reset any previous recording
+            self._heard_voice = False
             
             self.button.set_state(COLOR_RECORD, "■")
             self._set_status("Recording…")
@@ -437,10 +600,11 @@ class SuperWhisperApp:
     def _on_hotkey(self):
         """Handle global hotkey (F9) presses."""
         # Debounce to prevent rapid triggers
-        now = time.time()
-        if now - self._last_hotkey_time < 0.3:
-            return
-        self._last_hotkey_time = now
+        with self._lock:
+            now = time.time()
+            if now - self._last_hotkey_time < 0.3:
+                return
+            self._last_hotkey_time = now
         
         if self.state == self.STATE_READY:
             if self.model is None:
@@ -454,48 +618,49 @@ class SuperWhisperApp:
         """Record audio with improved error handling and memory management."""
         stream = None
         try:
+            # Already imported and initialized by the loader thread
+            import sounddevice as sd
+
             # Verify microphone access
             try:
-                sd.check_input_settings(samplerate=settings.sample_rate, channels=1)
+                sd.check_input_settings(samplerate=self.settings.sample_rate, channels=1)
             except Exception as e:
                 raise AudioError(f"Microphone access denied: {e}")
 
-            # Start audio stream
+            # Start audio stream; the PortAudio callback only enqueues frames
+            audio_queue = queue.SimpleQueue()
+
+            def on_audio(indata, frames, time_info, status):
+                audio_queue.put_nowait(indata.copy())
+
             stream = sd.InputStream(
-                samplerate=settings.sample_rate,
+                samplerate=self.settings.sample_rate,
                 channels=1,
                 dtype="float32",
-                blocksize=1024
+                blocksize=2048,
+                callback=on_audio
             )
             stream.start()
 
             last_voice_time = time.time()
             start_time = time.time()
-            max_buffer_chunks = settings.max_duration * settings.sample_rate // 1024
+            max_samples = self._audio_ring.shape[0]
 
             while self.is_recording:
                 try:
-                    chunk, _ = stream.read(1024)
-                    
-                    # Voice activity detection
-                    amplitude = float(np.abs(chunk).max())
-                    if amplitude > settings.silence_threshold:
+                    # Drain everything queued since the last wakeup
+                    if self._store_chunks(self._drain_queue(audio_queue, timeout=0.1)):
                         last_voice_time = time.time()
 
-                    # Add to buffer with memory management
-                    self.audio_buffer.append(chunk.copy())
-                    
-                    # Prevent excessive memory usage
-                    if len(self.audio_buffer) > max_buffer_chunks:
-                        # Keep only recent audio (sliding window)
-                        self.audio_buffer = self.audio_buffer[-max_buffer_chunks//2:]
+                    if self._audio_write >= max_samples:
+                        break
 
                     current_time = time.time()
                     
                     # Auto-stop conditions
-                    if (current_time - last_voice_time) > settings.silence_duration:
+                    if (current_time - last_voice_time) > self.settings.silence_duration:
                         break
-                    if (current_time - start_time) > settings.max_duration:
+                    if (current_time - start_time) > self.settings.max_duration:
                         break
 
                 except Exception as e:
@@ -516,48 +681,92 @@ class SuperWhisperApp:
                 except Exception:
                     pass
 
+        # stop() waits for in-flight callbacks, so this picks up both the frames
+        # queued since the last drain and those delivered while stopping
+        self._store_chunks(self._drain_queue(audio_queue))
+
         # Move to transcription if we have audio
-        if self.audio_buffer:
+        if self._audio_write:
             self.root.after(0, self._set_transcribing_state)
         else:
             self.root.after(0, lambda: self._finish_with_message("No audio"))
 
+    @staticmethod
+    def _drain_queue(audio_queue, timeout=None):
+        """Return all queued chunks, waiting up to timeout for the first one."""
+        chunks = []
+        if timeout:
+            try:
+                chunks.append(audio_queue.get(timeout=timeout))
+            except queue.Empty:
+                return chunks
+        while True:
+            try:
+                chunks.append(audio_queue.get_nowait())
+            except queue.Empty:
+                return chunks
+
+    def _store_chunks(self, chunks):
+        """Copy chunks into the ring buffer (capped at max). Returns True on voice."""
+        max_samples = self._audio_ring.shape[0]
+        batch_start = self._audio_write
+        for chunk in chunks:
+            n = min(chunk.shape[0], max_samples - self._audio_write)
+            end = self._audio_write + n
+            self._audio_ring[self._audio_write:end] = chunk[:n, 0]
+            self._audio_write = end
+
+        # Voice activity detection over the whole batch
+        if self._audio_write == batch_start:
+            return False
+        batch = self._audio_ring[batch_start:self._audio_write]
+        # Two reductions, no temporary array (unlike np.abs)
+        amplitude = float(max(batch.max(), -batch.min()))
+        if amplitude > self.settings.silence_threshold:
+            self._heard_voice = True
+            return True
+        return False
+
     def _transcribe_audio(self):
         """Transcribe recorded audio with better error handling."""
-        temp_file = None
         try:
-            if not self.audio_buffer:
+            if not self._audio_write:
                 self.root.after(0, lambda: self._finish_with_message("No audio"))
                 return
 
-            # Concatenate and validate audio
-            audio_data = np.concatenate(self.audio_buffer, axis=0)
-            if audio_data.size == 0 or np.max(np.abs(audio_data)) < 1e-4:
+            # View of the recorded samples (no copy); clip in place and
+            # get the peak in one pass. faster-whisper accepts 16 kHz float32.
+            audio = self._audio_ring[:self._audio_write]
+            peak = self._clip_peak(audio, audio) if audio.size else 0.0
+            if peak < 1e-4:
                 self.root.after(0, lambda: self._finish_with_message("Too quiet"))
                 return
 
-            # Create temporary file
-            temp_file = f"temp_recording_{int(time.time())}.wav"
-            self._temp_files.append(temp_file)
-            
-            # Normalize and save audio
-            audio_int16 = (np.clip(audio_data, -1.0, 1.0) * 32767).astype(np.int16)
-            write(temp_file, settings.sample_rate, audio_int16)
+            # Skip Silero only for short clips that crossed silence_threshold;
+            # stopping on silence alone doesn't mean anyone spoke, and Whisper
+            # hallucinates text from plain room noise
+            duration = audio.size / self.settings.sample_rate
+            use_vad = duration > 3.0 or not self._heard_voice
 
             # Transcribe with Whisper
             segments, info = self.model.transcribe(
-                temp_file, 
-                vad_filter=True,
-                word_timestamps=False
+                audio,
+                beam_size=1,
+                best_of=1,
+                without_timestamps=True,
+                vad_filter=use_vad,
+                word_timestamps=False,
+                condition_on_previous_text=False,
+                language=self.settings.language
             )
             
-            # Extract text
-            text_segments = list(segments)
-            if not text_segments:
+            # Extract text in a single pass over the segment generator
+            parts = [segment.text for segment in segments]
+            if not parts:
                 self.root.after(0, lambda: self._finish_with_message("No speech"))
                 return
 
-            transcribed_text = "".join(segment.text for segment in text_segments).strip()
+            transcribed_text = "".join(parts).strip()
             
             if transcribed_text:
                 self._handle_transcription_result(transcribed_text)
@@ -568,24 +777,19 @@ class SuperWhisperApp:
         except Exception as e:
             self.root.after(0, lambda: self._show_error("Transcribe failed"))
         finally:
-            # Cleanup temporary files
-            self._cleanup_temp_files()
-            # Clear audio buffer to free memory
-            self.audio_buffer.clear()
+            # Reset write index; the ring buffer itself is reused
+            self._audio_write = 0
 
     def _handle_transcription_result(self, text):
         """Handle transcription result - copy to clipboard and optionally paste."""
         try:
             # Always copy to clipboard
-            pyperclip.copy(text)
+            self._copy_to_clipboard(text)
             
             # Auto-paste on macOS if enabled
-            if settings.auto_paste and platform.system() == "Darwin":
+            if self.settings.auto_paste and platform.system() == "Darwin":
                 try:
-                    subprocess.run([
-                        "osascript", "-e",
-                        'tell application "System Events" to keystroke "v" using command down'
-                    ], check=False, timeout=2, capture_output=True)
+                    self._send_paste_keystroke()
                 except Exception:
                     # If paste fails, text is still in clipboard
                     pass
@@ -594,49 +798,109 @@ class SuperWhisperApp:
             # Even if clipboard fails, don't crash
             self._show_error("Clipboard error")
 
+    @staticmethod
+    def _copy_to_clipboard(text):
+        """Copy text, writing NSPasteboard directly on macOS to skip pbcopy."""
+        if platform.system() == "Darwin":
+            try:
+                from AppKit import NSPasteboard, NSPasteboardTypeString
+                pb = NSPasteboard.generalPasteboard()
+                pb.clearContents()
+                if pb.setString_forType_(text, NSPasteboardTypeString):
+                    return
+            except Exception:
+                # Missing PyObjC or a pasteboard runtime error: use pyperclip
+                pass
+        import pyperclip
+        pyperclip.copy(text)
+
+    @staticmethod
+    def _send_paste_keystroke():
+        """Send Cmd+V, posting Quartz events directly instead of forking osascript."""
+        kVK_ANSI_V = 0x09
+        try:
+            from Quartz import (
+                CGEventCreateKeyboardEvent, CGEventKeyboardGetUnicodeString,
+                CGEventPost, CGEventSetFlags, kCGHIDEventTap, kCGEventFlagMaskCommand
+            )
+            # kVK_ANSI_V is a key position; only use it if the current layout
+            # types "v" there (not true on e.g. Dvorak)
+            probe = CGEventCreateKeyboardEvent(None, kVK_ANSI_V, True)
+            _, chars = CGEventKeyboardGetUnicodeString(probe, 1, None, None)
+            use_quartz = chars == "v"
+        except Exception:
+            use_quartz = False
+
+        if not use_quartz:
+            # osascript's keystroke "v" respects the active keyboard layout
+            import subprocess
+            subprocess.run([
+                "osascript", "-e",
+                'tell application "System Events" to keystroke "v" using command down'
+            ], check=False, timeout=2, capture_output=True)
+            return
+
+        for key_down in (True, False):
+            event = CGEventCreateKeyboardEvent(None, kVK_ANSI_V, key_down)
+            CGEventSetFlags(event, kCGEventFlagMaskCommand)
+            CGEventPost(kCGHIDEventTap, event)
+
     def _finish_with_message(self, message):
         """Show completion message and return to ready state."""
         self._set_status(message)
         self.root.after(1500, self._set_ready_state)
 
-    def _cleanup_temp_files(self):
-        """Clean up temporary audio files."""
-        for temp_file in self._temp_files:
-            try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-            except Exception:
-                pass
-        self._temp_files.clear()
-
     def _set_status(self, message):
-        """Update status label."""
+        """Update status label, skipping redundant reconfigures."""
+        if message == self._last_ui_status:
+            return
+        self._last_ui_status = message
         if hasattr(self, 'status'):
             self.status.config(text=message)
 
+    def _post_status(self, message):
+        """Queue a status update from a worker thread, dropping duplicates."""
+        if message == self._last_ui_status:
+            return
+        # after(0) like every other worker post, so updates stay in order
+        self.root.after(0, lambda: self._set_status(message))
+
     # Global hotkey management
     def _start_global_hotkey(self):
-        """Start global hotkey listener."""
+        """Start global hotkey listener. Returns True if it can receive keys."""
         if not PYNPUT_AVAILABLE:
-            return
+            return False
 
         def on_press(key):
             try:
                 if key == keyboard.Key.f9:
-                    now = time.time()
-                    if now - self._last_hotkey_time < 0.25:
-                        return
                     self.root.after(0, self._on_hotkey)
             except Exception:
                 pass
 
+        # On Windows, reject non-F9 events in the low-level hook before
+        # pynput translates them and calls on_press
+        listener_kwargs = {}
+        if platform.system() == "Windows":
+            listener_kwargs["win32_event_filter"] = (
+                lambda msg, data: data.vkCode == HOTKEY_WIN32_VK
+            )
+
         try:
             self._stop_global_hotkey()
-            self._listener = keyboard.Listener(on_press=on_press)
+            self._listener = keyboard.Listener(on_press=on_press, **listener_kwargs)
             self._listener.daemon = True
             self._listener.start()
+            if platform.system() == "Darwin":
+                # Without Accessibility permission the listener runs but never
+                # receives events. IS_TRUSTED is only set once the listener
+                # thread is running, so wait for it before reading it.
+                self._listener.wait()
+                return bool(getattr(self._listener, "IS_TRUSTED", False))
+            return True
         except Exception:
-            pass
+            self._listener = None
+            return False
 
     def _stop_global_hotkey(self):
         """Stop global hotkey listener."""
@@ -661,9 +925,9 @@ class SuperWhisperApp:
 
     def _end_drag(self, event):
         """End window drag and save position."""
-        settings.window_x = self.root.winfo_x()
-        settings.window_y = self.root.winfo_y()
-        settings.save()
+        self.settings.window_x = self.root.winfo_x()
+        self.settings.window_y = self.root.winfo_y()
+        self.settings.save()
 
     def cleanup(self):
         """Clean up resources before closing."""
@@ -678,16 +942,13 @@ class SuperWhisperApp:
             if thread and thread.is_alive():
                 thread.join(timeout=1.0)
         
-        # Cleanup temp files
-        self._cleanup_temp_files()
-        
         # Clear model to free memory
         if self.model:
             del self.model
             self.model = None
         
         # Save settings
-        settings.save()
+        self.settings.save()
         
         # Close window
         try: